@@ -273,8 +273,8 @@ def write_with_hy8runner(project: Hy8Project, directory: Path, hy8_exe: Path | N
     runner.project_notes = project.notes
     runner.set_hy8_exe_path(hy8_exe_path=str(exe_dir))
     runner.set_hy8_file(hy8_file=str(hy8_path))
-    type(runner).si_units = project.units is UnitSystem.SI
-    type(runner).exit_loss_option = project.exit_loss_option
+    runner.si_units = project.units is UnitSystem.SI
+    runner.exit_loss_option = project.exit_loss_option
 
     while len(runner.crossings) < len(project.crossings):
         runner.add_crossing()
@@ -332,6 +332,7 @@ def _synchronize_culverts(runner: Hy8Runner, culverts: list[CulvertBarrel], cros
     while len(crossing.culverts) > len(culverts):
         runner.delete_culvert_barrel(index_crossing=crossing_index, index_culvert=len(crossing.culverts) - 1)
 
+    hy8_culverts: list[Hy8RunnerCulvertBarrel] = crossing.culverts
     for culvert_index, culvert in enumerate(culverts):
         runner.set_culvert_barrel_name(
             name=culvert.name or f"Culvert {culvert_index + 1}",
@@ -368,7 +369,7 @@ def _synchronize_culverts(runner: Hy8Runner, culverts: list[CulvertBarrel], cros
             index_crossing=crossing_index,
             index_culvert=culvert_index,
         )
-        hy8_culvert: Hy8RunnerCulvertBarrel = runner.crossings[crossing_index].culverts[culvert_index]
+        hy8_culvert: Hy8RunnerCulvertBarrel = hy8_culverts[culvert_index]
         hy8_culvert.notes = culvert.notes
         hy8_culvert.manning_n_top = culvert.manning_n_top
         hy8_culvert.manning_n_bottom = culvert.manning_n_bottom
@@ -487,29 +488,31 @@ def slugify(name: str) -> str:
     return safe.strip("_") or "project"
 
 
+_SURFACE_NAMES: dict[RoadwaySurface, str] = {
+    RoadwaySurface.PAVED: "paved",
+    RoadwaySurface.GRAVEL: "gravel",
+    RoadwaySurface.USER_DEFINED: "user-defined",
+}
+_SHAPE_NAMES: dict[CulvertShape, str] = {
+    CulvertShape.CIRCLE: "circle",
+    CulvertShape.BOX: "box",
+}
+_MATERIAL_NAMES: dict[CulvertMaterial, str] = {
+    CulvertMaterial.CONCRETE: "concrete",
+    CulvertMaterial.CORRUGATED_STEEL: "corrugated steel",
+}
+
+
 def _surface_name(surface: RoadwaySurface) -> str:
-    mapping: dict[RoadwaySurface, str] = {
-        RoadwaySurface.PAVED: "paved",
-        RoadwaySurface.GRAVEL: "gravel",
-        RoadwaySurface.USER_DEFINED: "user-defined",
-    }
-    return mapping[surface]
+    return _SURFACE_NAMES[surface]
 
 
 def _shape_name(shape: CulvertShape) -> str:
-    mapping: dict[CulvertShape, str] = {
-        CulvertShape.CIRCLE: "circle",
-        CulvertShape.BOX: "box",
-    }
-    return mapping[shape]
+    return _SHAPE_NAMES[shape]
 
 
 def _material_name(material: CulvertMaterial) -> str:
-    mapping: dict[CulvertMaterial, str] = {
-        CulvertMaterial.CONCRETE: "concrete",
-        CulvertMaterial.CORRUGATED_STEEL: "corrugated steel",
-    }
-    return mapping[material]
+    return _MATERIAL_NAMES[material]
 
 
 def _format_value(value: float) -> str:
@@ -63,7 +63,8 @@ def resolve_hy8_path() -> Path:
     Returns:
         The resolved path to the HY-8 executable.
     """
-    env: str | None = os.environ.get("HY8_EXE") or os.environ.get("HY8_EXECUTABLE")
+    environ = os.environ
+    env: str | None = environ.get("HY8_EXE") or environ.get("HY8_EXECUTABLE")
     if env:
         return Path(env).expanduser()
     configured: Path | None = read_hy8_path_file()
@@ -23,6 +23,16 @@ from .type_helpers import (
 )
 from .units import cms_to_cfs, metres_to_feet
 
+# Enum members and values resolved once at import so the per-crossing/per-culvert
+# writers avoid repeated attribute and descriptor lookups.
+_CONCRETE: int = CulvertMaterial.CONCRETE.value
+_BOX: CulvertShape = CulvertShape.BOX
+_USER_DEFINED: FlowMethod = FlowMethod.USER_DEFINED
+_MIN_DESIGN_MAX: FlowMethod = FlowMethod.MIN_DESIGN_MAX
+
+# Serialization is many small sequential writes; a 1 MiB buffer lets them reach the OS in a few large chunks.
+_WRITE_BUFFER_SIZE: int = 1 << 20
+
 
 class Hy8FileWriter:
     """
@@ -58,10 +68,15 @@ class Hy8FileWriter:
             raise FileExistsError(f"{output_path} already exists. Set overwrite=True to replace it.")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as handle:
+        with self._open_for_hy8(output_path) as handle:
             self._write_project(handle)
         return output_path
 
+    @staticmethod
+    def _open_for_hy8(path: Path) -> TextIO:
+        """Open `path` for writing HY-8 text with a large write buffer."""
+        return path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE)
+
     def _write_project(self, handle: TextIO) -> None:
         """Write top-level project metadata and each crossing."""
         # The version number is written without a decimal if it's a whole number.
@@ -97,7 +112,7 @@ class Hy8FileWriter:
     def _write_flow(self, handle: TextIO, crossing: CulvertCrossing) -> None:
         """Serialize the discharge definition HY-8 expects."""
         flow: FlowDefinition = crossing.flow
-        discharge_method: int = 0 if flow.method is FlowMethod.MIN_DESIGN_MAX else 1
+        discharge_method: int = 0 if flow.method is _MIN_DESIGN_MAX else 1
         min_flow, design_flow, max_flow = self._flow_range_values(flow)
         self._write_card(
             handle,
@@ -134,7 +149,7 @@ class Hy8FileWriter:
         """Guarantee HY-8 sees two user flows, inserting a 10% value if needed."""
         # The HY-8 GUI requires at least two points for a user-defined flow curve.
         # If only one is provided, we add a second point at 10% of the value.
-        if flow.method is not FlowMethod.USER_DEFINED or len(flow_values) != 1:
+        if flow.method is not _USER_DEFINED or len(flow_values) != 1:
             return flow_values, labels
         base_value: float = flow_values[0]
         generated_value: float = base_value * 0.1
@@ -154,7 +169,7 @@ class Hy8FileWriter:
         """Return the min/design/max tuple HY-8 uses for min-design-max flows."""
         # This ensures the flow definition's attributes are synchronized with the
         # sequence values before being written.
-        if flow.method is FlowMethod.MIN_DESIGN_MAX:
+        if flow.method is _MIN_DESIGN_MAX:
             values: list[float] = flow.sequence()
             if len(values) >= 3:
                 flow.minimum, flow.design, flow.maximum = values[0], values[1], values[2]
@@ -217,9 +232,9 @@ class Hy8FileWriter:
         self._write_card(handle, "STARTCULVERT", f'"{culvert.name}"')
         culvert_shape: int = culvert.shape.value
         culvert_material: int = culvert.material.value
-        if culvert.shape is CulvertShape.BOX:
+        if culvert.shape is _BOX:
             # HY-8 expects boxes to be flagged as concrete, even if the user set a different material.
-            culvert_material = CulvertMaterial.CONCRETE.value
+            culvert_material = _CONCRETE
         self._write_card(handle, "CULVERTSHAPE", culvert_shape)
         self._write_card(handle, "CULVERTMATERIAL", culvert_material)
         if culvert.manning_n_top is not None and culvert.manning_n_bottom is not None:
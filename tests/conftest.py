@@ -6,6 +6,10 @@ import sys
 import pytest
 from pathlib import Path
 from run_hy8.executor import Hy8Executable
+from run_hy8.models import Hy8Project
+from run_hy8.reader import load_project_from_hy8
+
+from .sample_data import CONFIG_JSON_BYTES, EXAMPLE_FILE
 
 PROJECT_ROOT: Path = Path(__file__).resolve().parents[1]
 SRC_PATH: Path = PROJECT_ROOT / "src"
@@ -13,15 +17,30 @@ SRC_PATH: Path = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
+
 def pytest_runtest_setup(item: pytest.Item) -> None:
     """Skip tests marked with requires_hy8 if the executable is not available."""
     if "requires_hy8" in item.keywords:
         # Check if we are on Windows
         if sys.platform != "win32":
             pytest.skip("HY-8 executable is only supported on Windows")
-        
+
         # Check if the executable is configured/available
         try:
             Hy8Executable()
         except Exception:
             pytest.skip("HY-8 executable not found or not configured")
+
+
+@pytest.fixture(scope="session")
+def config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the sample JSON config once per session; tests must treat the file as read-only."""
+    path: Path = tmp_path_factory.mktemp("config") / "project.json"
+    path.write_bytes(CONFIG_JSON_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def example_project() -> Hy8Project:
+    """Parse example_crossings.hy8 once per session; tests must not mutate the shared project."""
+    return load_project_from_hy8(path=EXAMPLE_FILE)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 # 1. Standard python modules
-import datetime
 import os
 import subprocess
+import time
 from _collections_abc import Sequence
+from typing import IO
 
 # 2. Third party modules
 
@@ -45,15 +46,26 @@ class Hy8Runner:
         """
         Hy8Runner.name_counter += 1
 
+        # Per-runner settings start from the class-level defaults.
+        self.hy8_exe_path: str = hy8_exe_path or Hy8Runner.hy8_exe_path
+        self.hy8_basename_exe: str = Hy8Runner.hy8_basename_exe
+        self.version: float = Hy8Runner.version
+        self.si_units: bool = Hy8Runner.si_units
+        self.exit_loss_option: int = Hy8Runner.exit_loss_option
+
         self.crossings: list[Hy8RunnerCulvertCrossing] = [Hy8RunnerCulvertCrossing(0)]
         self.hy8_file: str = hy8_file
-        if hy8_exe_path != "":
-            Hy8Runner.hy8_exe_path = hy8_exe_path
 
         self.project_title: str = ""
         self.designer_name: str = ""
         self.project_notes: str = ""
 
+        # HY-8 processes launched by the run_*_async methods that have not been waited on yet.
+        self._pending: list[subprocess.Popen[bytes]] = []
+
+        # (hy8_exe_path, joined executable path); rebuilt whenever hy8_exe_path changes.
+        self._hy8_exe_full: tuple[str, str] | None = None
+
     def set_hy8_exe_path(self, hy8_exe_path: str) -> None:
         """Set the path to the HY-8 executable.
 
@@ -61,6 +73,21 @@ class Hy8Runner:
             hy8_exe_path (string): The path to the HY-8 executable.
         """
         self.hy8_exe_path = hy8_exe_path
+        self._hy8_exe_full = None
+
+    @property
+    def _resolved_exe(self) -> str:
+        """The full path to the HY-8 executable, joined once per exe path.
+
+        Only the join is cached; whether the file exists is checked on every validation.
+        """
+        cached = self._hy8_exe_full
+        if cached is None or cached[0] != self.hy8_exe_path:
+            cached = self._hy8_exe_full = (
+                self.hy8_exe_path,
+                os.path.join(self.hy8_exe_path, self.hy8_basename_exe),
+            )
+        return cached[1]
 
     def set_hy8_file(self, hy8_file: str) -> None:
         """Set the path to the HY-8 file that we will create.
@@ -68,7 +95,8 @@ class Hy8Runner:
         Args:
             hy8_file (string): The path to the HY-8 file.
         """
-        if not hy8_file.lower().endswith(".hy8"):
+        # Lower only the suffix rather than the whole path.
+        if hy8_file[-4:].lower() != ".hy8":
             hy8_file += ".hy8"
         self.hy8_file = hy8_file
 
@@ -100,15 +128,17 @@ class Hy8Runner:
         Returns:
             int: The index of the new culvert.
         """
+        crossings = self.crossings
+        n_cross = len(crossings)
         if index_crossing is None:
-            index_crossing = len(self.crossings) - 1
-        if index_crossing >= len(self.crossings):
+            index_crossing = n_cross - 1
+        if index_crossing >= n_cross:
             return -1
 
-        self.crossings[index_crossing].culverts.append(
-            Hy8RunnerCulvertBarrel(len(self.crossings[index_crossing].culverts))
-        )
-        return len(self.crossings[index_crossing].culverts) - 1
+        culverts = crossings[index_crossing].culverts
+        n_cul = len(culverts)
+        culverts.append(Hy8RunnerCulvertBarrel(n_cul))
+        return n_cul
 
     def delete_culvert_barrel(self, index_crossing: int | None = None, index_culvert: int | None = None) -> None:
         """Set the path to the HY-8 executable.
@@ -116,16 +146,20 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the culvert_barrel.
         """
+        crossings = self.crossings
+        n_cross = len(crossings)
         if index_crossing is None:
-            index_crossing = len(self.crossings) - 1
-        if index_crossing >= len(self.crossings):
+            index_crossing = n_cross - 1
+        if index_crossing >= n_cross:
             return
+        culverts = crossings[index_crossing].culverts
+        n_cul = len(culverts)
         if index_culvert is None:
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        if index_culvert >= len(self.crossings[index_crossing].culverts):
+            index_culvert = n_cul - 1
+        if index_culvert >= n_cul:
             return
-        del self.crossings[index_crossing].culverts[index_culvert]
-        if len(self.crossings[index_crossing].culverts) == 0:
+        del culverts[index_culvert]
+        if n_cul == 1:
             self.add_culvert_barrel(index_crossing)
 
     def set_culvert_crossing_name(self, name: str, index: int | None = None) -> None:
@@ -173,7 +207,8 @@ class Hy8Runner:
             index = len(self.crossings) - 1
 
         self.crossings[index].flow.method = "user-defined"
-        self.crossings[index].flow.flow_list = list(flow_list)
+        # Keep a caller-supplied list as-is; only other sequences need copying.
+        self.crossings[index].flow.flow_list = flow_list if isinstance(flow_list, list) else list(flow_list)
 
     def set_discharge_min_max_inc_flow(
         self,
@@ -305,7 +340,9 @@ class Hy8Runner:
             index = len(self.crossings) - 1
         self.crossings[index].tw_type = 5
         self.crossings[index].tw_invert_elevation = invert_elevation
-        self.crossings[index].tw_rating_curve = [list(point) for point in rating_curve]
+        self.crossings[index].tw_rating_curve = [
+            point if isinstance(point, list) else list(point) for point in rating_curve
+        ]
 
     def set_roadway_width(self, roadway_width: float, index: int | None = None) -> None:
         """Set the roadway width for the culvert crossing.
@@ -345,8 +382,8 @@ class Hy8Runner:
         if index is None or index >= len(self.crossings):
             index = len(self.crossings) - 1
         self.crossings[index].roadway_shape = 2
-        self.crossings[index].roadway_stations = list(stations)
-        self.crossings[index].roadway_elevations = list(elevations)
+        self.crossings[index].roadway_stations = stations if isinstance(stations, list) else list(stations)
+        self.crossings[index].roadway_elevations = elevations if isinstance(elevations, list) else list(elevations)
 
     def set_constant_roadway(self, roadway_length: float, elevation: float, index: int | None = None) -> None:
         """Set the roadway stations to a constant elevation for the culvert crossing.
@@ -363,6 +400,23 @@ class Hy8Runner:
         self.crossings[index].roadway_stations = stations
         self.crossings[index].roadway_elevations = elevations
 
+    def _culvert_barrel(self, index_crossing: int | None, index_culvert: int | None) -> Hy8RunnerCulvertBarrel:
+        """Return the barrel the set_culvert_barrel_* methods act on; out-of-range indices select the last one.
+
+        Args:
+            index_crossing (int): The index of the crossing.
+            index_culvert (int): The index of the barrel.
+        """
+        crossings = self.crossings
+        n_cross = len(crossings)
+        if index_crossing is None or index_crossing >= n_cross:
+            index_crossing = n_cross - 1
+        culverts = crossings[index_crossing].culverts
+        n_cul = len(culverts)
+        if index_culvert is None or index_culvert >= n_cul:
+            index_culvert = n_cul - 1
+        return culverts[index_culvert]
+
     def set_culvert_barrel_name(
         self,
         name: str,
@@ -376,11 +430,8 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].name = name
+        barrel = self._culvert_barrel(index_crossing, index_culvert)
+        barrel.name = name
 
     def set_culvert_barrel_shape(
         self,
@@ -395,11 +446,8 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].shape = shape
+        barrel = self._culvert_barrel(index_crossing, index_culvert)
+        barrel.shape = shape
 
     def set_culvert_barrel_span_and_rise(
         self,
@@ -416,13 +464,10 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].span = span
+        barrel = self._culvert_barrel(index_crossing, index_culvert)
+        barrel.span = span
         if rise is not None:
-            self.crossings[index_crossing].culverts[index_culvert].rise = rise
+            barrel.rise = rise
 
     def set_culvert_barrel_material(
         self,
@@ -437,11 +482,8 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].material = material
+        barrel = self._culvert_barrel(index_crossing, index_culvert)
+        barrel.material = material
 
     def set_culvert_barrel_site_data(
         self,
@@ -462,14 +504,11 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].inlet_invert_station = inlet_invert_station
-        self.crossings[index_crossing].culverts[index_culvert].inlet_invert_elevation = inlet_invert_elevation
-        self.crossings[index_crossing].culverts[index_culvert].outlet_invert_station = outlet_invert_station
-        self.crossings[index_crossing].culverts[index_culvert].outlet_invert_elevation = outlet_invert_elevation
+        barrel = self._culvert_barrel(index_crossing, index_culvert)
+        barrel.inlet_invert_station = inlet_invert_station
+        barrel.inlet_invert_elevation = inlet_invert_elevation
+        barrel.outlet_invert_station = outlet_invert_station
+        barrel.outlet_invert_elevation = outlet_invert_elevation
 
     def set_culvert_barrel_number_of_barrels(
         self,
@@ -484,11 +523,8 @@ class Hy8Runner:
             index_crossing (int): The index of the crossing.
             index_culvert (int): The index of the barrel.
         """
-        if index_crossing is None or index_crossing >= len(self.crossings):
-            index_crossing = len(self.crossings) - 1
-        if index_culvert is None or index_culvert >= len(self.crossings[index_crossing].culverts):
-            index_culvert = len(self.crossings[index_crossing].culverts) - 1
-        self.crossings[index_crossing].culverts[index_culvert].number_of_barrels = number_of_barrels
+        barrel = self._culvert_barrel(index_crossing, index_culvert)
+        barrel.number_of_barrels = number_of_barrels
 
     def validate_crossings_data(self, overwrite: bool = True) -> tuple[bool, str]:
         """Validate the data.
@@ -497,7 +533,7 @@ class Hy8Runner:
             bool: True if the data is valid.
             string: The error message if the data is not valid.
         """
-        messages = ""
+        parts: list[str] = []
         result = True
 
         for crossing_index, crossing in enumerate(self.crossings):
@@ -505,77 +541,82 @@ class Hy8Runner:
             flow_result, flow_messages = crossing.flow.validate_crossings_data(crossing_str)
             if not flow_result:
                 result = False
-            messages += flow_messages
+            parts.append(flow_messages)
             if crossing.tw_type == 1:
                 if crossing.tw_bottom_width <= 0.0:
-                    messages += f"{crossing_str}Enter a tailwater bottom width.\n"
+                    parts.append(f"{crossing_str}Enter a tailwater bottom width.\n")
                     result = False
                 if crossing.tw_channel_slope <= 0.0:
-                    messages += f"{crossing_str}Enter a tailwater channel slope.\n"
+                    parts.append(f"{crossing_str}Enter a tailwater channel slope.\n")
                     result = False
                 if crossing.tw_manning_n <= 0.0:
-                    messages += f"{crossing_str}Enter a tailwater channel Manning's n value.\n"
+                    parts.append(f"{crossing_str}Enter a tailwater channel Manning's n value.\n")
                     result = False
                 if crossing.tw_invert_elevation <= 0.0:
-                    messages += f"{crossing_str}Enter a tailwater invert elevation.\n"
+                    parts.append(f"{crossing_str}Enter a tailwater invert elevation.\n")
                     result = False
             elif crossing.tw_type == 5:
                 if len(crossing.tw_rating_curve) == 0:
-                    messages += f"{crossing_str}Enter a tailwater Rating curve.\n"
+                    parts.append(f"{crossing_str}Enter a tailwater Rating curve.\n")
                     result = False
             elif crossing.tw_type == 6:
                 if crossing.tw_constant_elevation < crossing.tw_invert_elevation:
-                    messages += (
+                    parts.append(
                         f"{crossing_str}Tailwater constant elevation must be greater than tailwater invert elevation.\n"
                     )
                     result = False
             if crossing.roadway_width <= 0:
-                messages += f"{crossing_str}Roadway width must be greater than zero.\n"
+                parts.append(f"{crossing_str}Roadway width must be greater than zero.\n")
                 result = False
             if len(crossing.roadway_stations) < 2:
-                messages += f"{crossing_str}Roadway stations & elevations must have at least two values.\n"
+                parts.append(f"{crossing_str}Roadway stations & elevations must have at least two values.\n")
                 result = False
             if len(crossing.roadway_stations) != len(crossing.roadway_elevations):
-                messages += f"{crossing_str}Roadway stations and elevations must have the same number of values.\n"
+                parts.append(f"{crossing_str}Roadway stations and elevations must have the same number of values.\n")
                 result = False
             if len(crossing.culverts) == 0:
-                messages += f"{crossing_str}Crossing must have at least one culvert barrel.\n"
+                parts.append(f"{crossing_str}Crossing must have at least one culvert barrel.\n")
                 result = False
             for barrel in crossing.culverts:
                 culvert_barrel_str = f"{crossing_str}Culvert barrel: {barrel.name}\t"
                 if barrel.span <= 0.0:
-                    messages += f"{culvert_barrel_str}span of the culvert must be specified.\n"
+                    parts.append(f"{culvert_barrel_str}span of the culvert must be specified.\n")
                     result = False
                 if barrel.shape == "box" and barrel.rise <= 0.0:
-                    messages += f"{culvert_barrel_str}rise of the box culvert must be specified.\n"
+                    parts.append(f"{culvert_barrel_str}rise of the box culvert must be specified.\n")
                     result = False
                 if barrel.number_of_barrels <= 0:
-                    messages += f"{culvert_barrel_str}Number of barrels must be greater than zero.\n"
+                    parts.append(f"{culvert_barrel_str}Number of barrels must be greater than zero.\n")
                     result = False
 
-        hy8_exe = os.path.join(self.hy8_exe_path, self.hy8_basename_exe)
-        if not os.path.exists(hy8_exe):
-            messages += f"HY-8 executable does not exist: {hy8_exe}\n"
+        hy8_exe = self._resolved_exe
+        if not os.path.isfile(hy8_exe):
+            parts.append(f"HY-8 executable does not exist: {hy8_exe}\n")
             result = False
 
+        # exists, not isfile: a directory at the HY-8 path must take the "locked" branch rather than be opened.
+        hy8_file_exists = self.hy8_file != "" and os.path.exists(self.hy8_file)
+
         if self.hy8_file == "":
-            messages += "HY-8 file must be specified.\n"
+            parts.append("HY-8 file must be specified.\n")
             result = False
-        elif os.path.exists(self.hy8_file):
+        elif hy8_file_exists:
             if overwrite:
                 try:
                     with open(self.hy8_file, "w"):
                         pass  # We have verified that it isn't locked
                 except OSError:
-                    messages += f"File '{self.hy8_file}' is locked."
-                    return False, messages
+                    parts.append(f"File '{self.hy8_file}' is locked.")
+                    return False, "".join(parts)
             else:
-                messages += f"HY-8 file already exists: {self.hy8_file}\n"
+                parts.append(f"HY-8 file already exists: {self.hy8_file}\n")
                 result = False
-        elif os.path.dirname(self.hy8_file) != "" and not os.path.exists(os.path.dirname(self.hy8_file)):
-            os.makedirs(os.path.dirname(self.hy8_file))
+        else:
+            hy8_dir = os.path.dirname(self.hy8_file)
+            if hy8_dir != "" and not os.path.isdir(hy8_dir):
+                os.makedirs(hy8_dir)
 
-        return result, messages
+        return result, "".join(parts)
 
     def create_hy8_file(self, overwrite: bool = True) -> tuple[bool, str]:
         """Create the HY-8 file.
@@ -595,64 +636,119 @@ class Hy8Runner:
             return False, "HY-8 file already exists."
 
         units = 0
-        if Hy8Runner.si_units:
+        if self.si_units:
             units = 1
-        with open(self.hy8_file, "w") as hy8_file:
-            hy8_file.write(f"HY8PROJECTFILE{Hy8Runner.version}\n")
-            hy8_file.write(f"UNITS  {units}\n")
-            hy8_file.write(f"EXITLOSSOPTION  {Hy8Runner.exit_loss_option}\n")
-            hy8_file.write(f"PROJTITLE  {self.project_title}\n")
-            hy8_file.write(f"PROJDESIGNER  {self.designer_name}\n")
-            hy8_file.write(f"STARTPROJNOTES  {self.project_notes}\nENDPROJNOTES\n")
-            hy8_file.write(f"PROJDATE  {datetime.datetime.now().timestamp() / 3600}\n")
-            hy8_file.write(f"NUMCROSSINGS  {len(self.crossings)}\n")
-
-            for crossing in self.crossings:
-                crossing.write_crossing_to_file(hy8_file)
+        # Build the whole project in memory and hand it to the file in one write.
+        buf: list[str] = [
+            f"HY8PROJECTFILE{self.version}\n",
+            f"UNITS  {units}\n",
+            f"EXITLOSSOPTION  {self.exit_loss_option}\n",
+            f"PROJTITLE  {self.project_title}\n",
+            f"PROJDESIGNER  {self.designer_name}\n",
+            f"STARTPROJNOTES  {self.project_notes}\nENDPROJNOTES\n",
+            f"PROJDATE  {time.time() / 3600.0}\n",
+            f"NUMCROSSINGS  {len(self.crossings)}\n",
+        ]
+        for crossing in self.crossings:
+            buf.append(crossing.render_crossing())
+        buf.append("ENDPROJECTFILE\n")
 
-            hy8_file.write("ENDPROJECTFILE\n")
+        with self.open_for_hy8(self.hy8_file) as hy8_file:
+            hy8_file.write("".join(buf))
+            hy8_file.flush()
 
         messages += f"HY-8 file created: {self.hy8_file}\n"
         return result, messages
 
-    def _run_hy8_executable(self, commandline_arguments: Sequence[str]) -> None:
-        """Run the HY-8 executable with command line arguments.
+    @staticmethod
+    def open_for_hy8(path: str) -> IO[str]:
+        """Open an HY-8 file for writing with a 1 MiB buffer, since the file is written sequentially.
+
+        Args:
+            path (string): The path to the HY-8 file.
+        """
+        return open(path, "w", buffering=1 << 20)
+
+    def _hy8_command(self, commandline_arguments: Sequence[str]) -> list[str]:
+        """Build the HY-8 command line for the current HY-8 file.
 
         Args:
             commandline_arguments (list of strings): The command line arguments to pass to the HY-8
         """
-        hy8_exe: str = os.path.join(self.hy8_exe_path, self.hy8_basename_exe)
-        command: list[str] = [hy8_exe]
+        command: list[str] = [self._resolved_exe]
         command.extend(commandline_arguments)
         command.append(self.hy8_file)
+        return command
+
+    def _run_hy8_executable(self, commandline_arguments: Sequence[str]) -> None:
+        """Run the HY-8 executable with command line arguments.
+
+        Args:
+            commandline_arguments (list of strings): The command line arguments to pass to the HY-8
+        """
+        command: list[str] = self._hy8_command(commandline_arguments)
         completed_process = subprocess.run(command)
         if completed_process.returncode != 0:
             print(f"Command '{command}' failed with return code {completed_process.returncode}")
 
+    def _spawn_hy8_executable(self, commandline_arguments: Sequence[str]) -> None:
+        """Start the HY-8 executable without waiting for it to finish; see wait_all.
+
+        Args:
+            commandline_arguments (list of strings): The command line arguments to pass to the HY-8
+        """
+        self._pending.append(subprocess.Popen(self._hy8_command(commandline_arguments)))
+
+    def wait_all(self) -> list[int]:
+        """Wait for every HY-8 process started by the run_*_async methods.
+
+        HY-8 writes its results next to the HY-8 file, so concurrent runs should each use their own
+        Hy8Runner (and HY-8 file) rather than several async runs against the same file.
+
+        Returns:
+            list of int: The return code of each process, in launch order.
+        """
+        pending, self._pending = self._pending, []
+        return_codes: list[int] = []
+        for process in pending:
+            return_code = process.wait()
+            if return_code != 0:
+                print(f"Command '{process.args}' failed with return code {return_code}")
+            return_codes.append(return_code)
+        return return_codes
+
     def run_build_full_report(self) -> None:
         """Runs HY-8 and generates a full report in docx."""
         self._run_hy8_executable(["-BuildFullReport"])
 
+    def run_build_full_report_async(self) -> None:
+        """Starts HY-8 to generate a full report in docx without waiting; see wait_all."""
+        self._spawn_hy8_executable(["-BuildFullReport"])
+
     def run_open_save(self) -> None:
         """opens, runs, saves; this creates the rst, plt, rsql files. The rst file has HY-8 results.
         The plt file has the plot information. The rsql file has results beyond HY-8,
         which may be beneficial (freeboard depth, for example)."""
         self._run_hy8_executable(["-OpenRunSave"])
 
+    def run_open_save_async(self) -> None:
+        """Starts run_open_save without waiting for HY-8 to finish; see wait_all."""
+        self._spawn_hy8_executable(["-OpenRunSave"])
+
     def run_open_save_plots(self) -> None:
         """opens, runs, saves (same as last function), and creates bitmap plot images for each discharge."""
         self._run_hy8_executable(["-OpenRunSavePlots"])
 
-    def run_build_flow_tw_table(
-        self,
-        flow_coef: float = 1.1,
-        flow_const: float = 0.25,
-        units: str = "EN",
-        hw_inc: float = 0.25,
-        tw_inc: float = 0.25,
-    ) -> None:
-        """Generates a table for the culvert where it tells you the headwater for a given flow and tailwater."""
-        commandline_arguments: list[str] = [
+    def run_open_save_plots_async(self) -> None:
+        """Starts run_open_save_plots without waiting for HY-8 to finish; see wait_all."""
+        self._spawn_hy8_executable(["-OpenRunSavePlots"])
+
+    @staticmethod
+    def _flow_tw_table_arguments(
+        flow_coef: float, flow_const: float, units: str, hw_inc: float, tw_inc: float
+    ) -> list[str]:
+        """Command line arguments for the -BuildFlowTwTable option."""
+        return [
             "-BuildFlowTwTable",
             "FLOWCOEF",
             str(flow_coef),
@@ -665,11 +761,11 @@ class Hy8Runner:
             "TWINC",
             str(tw_inc),
         ]
-        self._run_hy8_executable(commandline_arguments)
 
-    def run_build_hw_tw_table(self, units: str = "EN", hw_inc: float = 0.25, tw_inc: float = 0.25) -> None:
-        """Generates a table for the culvert where it tells you the flow for a given headwater and tailwater."""
-        commandline_arguments: list[str] = [
+    @staticmethod
+    def _hw_tw_table_arguments(units: str, hw_inc: float, tw_inc: float) -> list[str]:
+        """Command line arguments for the -BuildHwTwTable option."""
+        return [
             "-BuildHwTwTable",
             "UNITS",
             units,
@@ -678,4 +774,33 @@ class Hy8Runner:
             "TWINC",
             str(tw_inc),
         ]
-        self._run_hy8_executable(commandline_arguments)
+
+    def run_build_flow_tw_table(
+        self,
+        flow_coef: float = 1.1,
+        flow_const: float = 0.25,
+        units: str = "EN",
+        hw_inc: float = 0.25,
+        tw_inc: float = 0.25,
+    ) -> None:
+        """Generates a table for the culvert where it tells you the headwater for a given flow and tailwater."""
+        self._run_hy8_executable(self._flow_tw_table_arguments(flow_coef, flow_const, units, hw_inc, tw_inc))
+
+    def run_build_flow_tw_table_async(
+        self,
+        flow_coef: float = 1.1,
+        flow_const: float = 0.25,
+        units: str = "EN",
+        hw_inc: float = 0.25,
+        tw_inc: float = 0.25,
+    ) -> None:
+        """Starts run_build_flow_tw_table without waiting for HY-8 to finish; see wait_all."""
+        self._spawn_hy8_executable(self._flow_tw_table_arguments(flow_coef, flow_const, units, hw_inc, tw_inc))
+
+    def run_build_hw_tw_table(self, units: str = "EN", hw_inc: float = 0.25, tw_inc: float = 0.25) -> None:
+        """Generates a table for the culvert where it tells you the flow for a given headwater and tailwater."""
+        self._run_hy8_executable(self._hw_tw_table_arguments(units, hw_inc, tw_inc))
+
+    def run_build_hw_tw_table_async(self, units: str = "EN", hw_inc: float = 0.25, tw_inc: float = 0.25) -> None:
+        """Starts run_build_hw_tw_table without waiting for HY-8 to finish; see wait_all."""
+        self._spawn_hy8_executable(self._hw_tw_table_arguments(units, hw_inc, tw_inc))
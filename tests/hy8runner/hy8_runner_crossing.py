@@ -12,6 +12,12 @@ __license__ = "All rights reserved"
 # This is not a FHWA product nor is it endorsed by FHWA.
 # FHWA will not be providing any technical supporting, funding or maintenance.
 
+# HY-8 SURFACE card values; unknown surfaces are written as paved.
+_SURFACE_INDEX: dict[str, int] = {"paved": 1, "gravel": 2, "user-defined": 3}
+
+# Written for crossings that never configured a culvert; render_culvert only rewrites its own derived fields.
+_DEFAULT_BARREL: Hy8RunnerCulvertBarrel = Hy8RunnerCulvertBarrel(0)
+
 
 class Hy8RunnerCulvertCrossing:
     """A class that will create an HY-8 file and run HY-8."""
@@ -30,18 +36,72 @@ class Hy8RunnerCulvertCrossing:
         self.tw_manning_n: float = 0.0
         self.tw_constant_elevation: float = 0.0
         self.tw_invert_elevation: float = 0.0
-        self.tw_rating_curve: list[list[float]] = []
+        # The list attributes below are created on first access (see the properties); most crossings
+        # replace them wholesale through the Hy8Runner setters.
+        self._tw_rating_curve: list[list[float]] | None = None
 
         self.roadway_shape: int = 1
         self.roadway_width: float = 0.0
-        self.roadway_stations: list[float] = []
-        self.roadway_elevations: list[float] = []
+        self._roadway_stations: list[float] | None = None
+        self._roadway_elevations: list[float] | None = None
         self.roadway_surface: str = "paved"
 
-        self.culverts: list[Hy8RunnerCulvertBarrel] = [Hy8RunnerCulvertBarrel(0)]
+        self._culverts: list[Hy8RunnerCulvertBarrel] | None = None
 
         self.uuid: str | None = None
 
+    @property
+    def tw_rating_curve(self) -> list[list[float]]:
+        """The tailwater rating curve points: flow, elevation, velocity."""
+        if self._tw_rating_curve is None:
+            self._tw_rating_curve = []
+        return self._tw_rating_curve
+
+    @tw_rating_curve.setter
+    def tw_rating_curve(self, rating_curve: list[list[float]]) -> None:
+        self._tw_rating_curve = rating_curve
+
+    @property
+    def roadway_stations(self) -> list[float]:
+        """The roadway stations."""
+        if self._roadway_stations is None:
+            self._roadway_stations = []
+        return self._roadway_stations
+
+    @roadway_stations.setter
+    def roadway_stations(self, stations: list[float]) -> None:
+        self._roadway_stations = stations
+
+    @property
+    def roadway_elevations(self) -> list[float]:
+        """The roadway elevations."""
+        if self._roadway_elevations is None:
+            self._roadway_elevations = []
+        return self._roadway_elevations
+
+    @roadway_elevations.setter
+    def roadway_elevations(self, elevations: list[float]) -> None:
+        self._roadway_elevations = elevations
+
+    @property
+    def culverts(self) -> list[Hy8RunnerCulvertBarrel]:
+        """The culvert barrels; a crossing starts with one default barrel."""
+        if self._culverts is None:
+            self._culverts = [Hy8RunnerCulvertBarrel(0)]
+        return self._culverts
+
+    @culverts.setter
+    def culverts(self, culverts: list[Hy8RunnerCulvertBarrel]) -> None:
+        self._culverts = culverts
+
+    def render_crossing(self) -> str:
+        """Return the crossing data as the text written to an HY-8 file.
+
+        Returns:
+            string: The crossing cards.
+        """
+        return "".join(self.crossing_lines())
+
     def write_crossing_to_file(self, hy8_file: IO[str]) -> tuple[bool, str]:
         """Write the crossing data to the file.
 
@@ -55,87 +115,104 @@ class Hy8RunnerCulvertCrossing:
         messages: str = ""
         result: bool = True
 
-        hy8_file.write(f'STARTCROSSING   "{self.name}"\n')
+        hy8_file.write("".join(self.crossing_lines()))
+
+        return result, messages
+
+    def crossing_lines(self) -> list[str]:
+        """Build the crossing cards, one newline-terminated string per entry.
+
+        Returns:
+            list of strings: The crossing cards in file order.
+        """
+        parts: list[str] = []
+        append = parts.append  # bound once; called for every card below
+
+        append(f'STARTCROSSING   "{self.name}"\n')
         # Placeholders
-        # hy8_file.write(f'LATITUDE {self.lattitude}\n')
-        # hy8_file.write(f'LONGITUDE    {self.longitude}\n')
-        # hy8_file.write(f'EXISTINGCROSSING {self.existing_crossing}\n')
-        # hy8_file.write(f'DISTRICT {self.district}\n')
-        # hy8_file.write(f'ADDRESS  {self.address}\n')
-        # hy8_file.write(f'COUNTY   {self.county}\n')
-        # hy8_file.write(f'CITY {self.city}\n')
-        # hy8_file.write(f'STATE    {self.state}\n')
-        # hy8_file.write(f'ZIP  {self.zip}\n')
-
-        hy8_file.write(f'STARTCROSSNOTES    "{self.notes}"\n')
+        # append(f'LATITUDE {self.lattitude}\n')
+        # append(f'LONGITUDE    {self.longitude}\n')
+        # append(f'EXISTINGCROSSING {self.existing_crossing}\n')
+        # append(f'DISTRICT {self.district}\n')
+        # append(f'ADDRESS  {self.address}\n')
+        # append(f'COUNTY   {self.county}\n')
+        # append(f'CITY {self.city}\n')
+        # append(f'STATE    {self.state}\n')
+        # append(f'ZIP  {self.zip}\n')
+
+        append(f'STARTCROSSNOTES    "{self.notes}"\n')
 
         # Discharge
         self.flow.compute_list()
         discharge_method: int = 0
-        if self.flow.method != "min-design-max":
+        if not self.flow.is_min_design_max:
             discharge_method = 1
         # Recurrence Flow not currently supported
-        hy8_file.write(f"DISCHARGERANGE {self.flow.flow_min} {self.flow.flow_design} {self.flow.flow_max}\n")
-        hy8_file.write(f"DISCHARGEMETHOD {discharge_method}\n")
-        hy8_file.write(f"DISCHARGEXYUSER {len(self.flow.flow_list)}\n")
-        for flow in self.flow.flow_list:
-            hy8_file.write(f"DISCHARGEXYUSER_Y {flow}\n")
+        append(f"DISCHARGERANGE {self.flow.flow_min} {self.flow.flow_design} {self.flow.flow_max}\n")
+        append(f"DISCHARGEMETHOD {discharge_method}\n")
+        append(f"DISCHARGEXYUSER {len(self.flow.flow_list)}\n")
+        parts.extend([f"DISCHARGEXYUSER_Y {flow}\n" for flow in self.flow.flow_list])
 
         # Tailwater
         # 1 for rectangular, 2 for trapezoidal, 3 for triangle, 4 for irregular, 5 for rating curve, 6 for constant tw
         channel_type: int = self.tw_type
-        hy8_file.write(f"TAILWATERTYPE {channel_type}\n")
-        hy8_file.write(
+        append(f"TAILWATERTYPE {channel_type}\n")
+        append(
             f"CHANNELGEOMETRY {self.tw_bottom_width} {self.tw_sideslope} {self.tw_channel_slope} "
             f"{self.tw_manning_n} {self.tw_invert_elevation}\n"
         )
-        tw_list: list[float] = [self.tw_constant_elevation] * 6
-        vel: float = 0.0
-        shear: float = 0.0
-        froude: float = 0.0
-        hy8_file.write(f"NUMRATINGCURVE {len(tw_list)}\n")
-        hy8_file.write(f"TWRATINGCURVE {tw_list[0]} {vel} {shear} {froude}\n")
-        for tw in tw_list:
-            hy8_file.write(f"              {tw} {vel} {shear} {froude}\n")
-        # hy8_file.write(f'IRREGTWCHANNELPTS {num_channel_pts}\n')
-        # hy8_file.write(f'IRREGTWCOORDS {station} {elevation} {self.tw_manning_n}\n')
+        # Constant tailwater: the same stage (with zero velocity, shear and Froude number) on every row.
+        # The legacy layout writes the TWRATINGCURVE row followed by six continuation rows.
+        # The stage is converted to text once (str matches the f-string formatting) and reused for every row.
+        tw_rows: int = 6
+        tw_row: str = str(self.tw_constant_elevation) + " 0.0 0.0 0.0\n"
+        append(f"NUMRATINGCURVE {tw_rows}\n")
+        append("TWRATINGCURVE " + tw_row)
+        append(("              " + tw_row) * tw_rows)
+        # append(f'IRREGTWCHANNELPTS {num_channel_pts}\n')
+        # append(f'IRREGTWCOORDS {station} {elevation} {self.tw_manning_n}\n')
         # for channel_pt in channel_pts:
-        #     hy8_file.write(f'              {station} {elevation} {self.tw_manning_n}\n')
+        #     append(f'              {station} {elevation} {self.tw_manning_n}\n')
         # Additonal rating curve data
-        size: int = len(self.tw_rating_curve)
+        rating_curve = self._tw_rating_curve
+        size: int = 0 if rating_curve is None else len(rating_curve)
         if size > 0:
-            hy8_file.write("RATINGCURVE\n")
-            hy8_file.write(f"NUMPOINTS {size}\n")
-            for index in range(size):
-                hy8_file.write(f"\tFLOW {self.tw_rating_curve[index][0]}\n")
-                hy8_file.write(f"\tELEVATION {self.tw_rating_curve[index][1]}\n")
-                hy8_file.write(f"\tVELOCITY {self.tw_rating_curve[index][2]}\n")
-            hy8_file.write("END RATINGCURVE\n")
+            append("RATINGCURVE\n")
+            append(f"NUMPOINTS {size}\n")
+            parts.extend(
+                [
+                    f"\tFLOW {flow}\n\tELEVATION {elevation}\n\tVELOCITY {velocity}\n"
+                    for flow, elevation, velocity, *_ in rating_curve
+                ]
+            )
+            append("END RATINGCURVE\n")
 
         # Roadway Data
-        surface_index: int = 1
-        if self.roadway_surface == "gravel":
-            surface_index = 2
-        elif self.roadway_surface == "user-defined":
-            surface_index = 3
-        hy8_file.write(f"ROADWAYSHAPE {self.roadway_shape}\n")
-        hy8_file.write(f"ROADWIDTH {self.roadway_width}\n")
-        # hy8_file.write(f'WEIRCOEFF {self.weir_coeff}\n')
-        hy8_file.write(f"SURFACE {surface_index}\n")
-        hy8_file.write(f"NUMSTATIONS {len(self.roadway_stations)}\n")
-        roadway_cardname: str = "ROADWAYSECDATA"
-        for station, elevation in zip(self.roadway_stations, self.roadway_elevations):
-            hy8_file.write(f"{roadway_cardname} {station} {elevation}\n")
-            roadway_cardname = "ROADWAYPOINT"
+        surface_index: int = _SURFACE_INDEX.get(self.roadway_surface, 1)
+        append(f"ROADWAYSHAPE {self.roadway_shape}\n")
+        append(f"ROADWIDTH {self.roadway_width}\n")
+        # append(f'WEIRCOEFF {self.weir_coeff}\n')
+        append(f"SURFACE {surface_index}\n")
+        stations = self._roadway_stations if self._roadway_stations is not None else []
+        elevations = self._roadway_elevations if self._roadway_elevations is not None else []
+        append(f"NUMSTATIONS {len(stations)}\n")
+        # The first point uses ROADWAYSECDATA and the rest ROADWAYPOINT.
+        points = list(zip(stations, elevations))
+        if points:
+            first_station, first_elevation = points[0]
+            roadway = [f"ROADWAYSECDATA {first_station} {first_elevation}\n"]
+            roadway.extend([f"ROADWAYPOINT {station} {elevation}\n" for station, elevation in points[1:]])
+            append("".join(roadway))
 
         # Culvert Data
-        hy8_file.write(f"NUMCULVERTS  {len(self.culverts)}\n")
+        culverts = self._culverts if self._culverts is not None else (_DEFAULT_BARREL,)
+        append(f"NUMCULVERTS  {len(culverts)}\n")
 
-        for culvert in self.culverts:
-            culvert.write_culvert_to_file(hy8_file)
+        for culvert in culverts:
+            append(culvert.render_culvert())
 
         if self.uuid is not None:
-            hy8_file.write(f"CROSSGUID            {self.uuid}\n")
-        hy8_file.write(f'ENDCROSSING "{self.name}"\n')
+            append(f"CROSSGUID            {self.uuid}\n")
+        append(f'ENDCROSSING "{self.name}"\n')
 
-        return result, messages
+        return parts
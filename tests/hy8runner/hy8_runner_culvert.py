@@ -9,10 +9,37 @@ __license__ = "All rights reserved"
 # This is not a FHWA product nor is it endorsed by FHWA.
 # FHWA will not be providing any technical supporting, funding or maintenance.
 
+# HY-8 CULVERTSHAPE / CULVERTMATERIAL card values; unknown names fall back to circle / concrete.
+_SHAPE: dict[str, int] = {"circle": 1, "box": 2}
+_MATERIAL: dict[str, int] = {"concrete": 1, "corrugated steel": 2}
+
 
 class Hy8RunnerCulvertBarrel:
     """A class that will create an HY-8 file and run HY-8."""
 
+    # Barrels are created in bulk for parameter sweeps; slots drop the per-instance __dict__.
+    __slots__ = (
+        "barrel_spacing",
+        "imp_inlet_edge_type",
+        "inlet_edge_type",
+        "inlet_edge_type71",
+        "inlet_invert_elevation",
+        "inlet_invert_station",
+        "inlet_type",
+        "manning_n_bottom",
+        "manning_n_top",
+        "material",
+        "name",
+        "notes",
+        "number_of_barrels",
+        "outlet_invert_elevation",
+        "outlet_invert_station",
+        "rise",
+        "roadway_station",
+        "shape",
+        "span",
+    )
+
     def __init__(self, count: int) -> None:
         """Initializes the HY-8 Runner class."""
         self.name: str = f"Culvert {count + 1}"
@@ -52,15 +79,20 @@ class Hy8RunnerCulvertBarrel:
         messages: str = ""
         result = True
 
-        hy8_file.write(f'STARTCULVERT    "{self.name}"\n')
+        hy8_file.write(self.render_culvert())
+
+        return result, messages
+
+    def render_culvert(self) -> str:
+        """Build the culvert cards as a single block of text.
 
+        Returns:
+            str: The culvert cards in file order, newline terminated.
+        """
         # Barrel data
-        culvert_shape = 1
-        culvert_material = 1
-        if self.material == "corrugated steel":
-            culvert_material = 2
-        if self.shape == "box":
-            culvert_shape = 2
+        culvert_shape = _SHAPE.get(self.shape, 1)
+        culvert_material = _MATERIAL.get(self.material, 1)
+        if culvert_shape == 2:
             culvert_material = 1  # boxes must be concrete (0)
 
         n_top: float | None = self.manning_n_top
@@ -71,28 +103,26 @@ class Hy8RunnerCulvertBarrel:
             if culvert_material == 2:
                 n_top = 0.024
                 n_bot = 0.024
-        hy8_file.write(f"CULVERTSHAPE    {culvert_shape}\n")
-        hy8_file.write(f"CULVERTMATERIAL {culvert_material}\n")
-        hy8_file.write(f"INLETTYPE {self.inlet_type}\n")
-        hy8_file.write(f"INLETEDGETYPE {self.inlet_edge_type}\n")
-        hy8_file.write(f"INLETEDGETYPE71 {self.inlet_edge_type71}\n")
-        hy8_file.write(f"IMPINLETEDGETYPE {self.imp_inlet_edge_type}\n")
-        hy8_file.write(f"BARRELDATA  {self.span} {self.rise} {n_top} {n_bot}\n")
-
-        # Site Data
-        hy8_file.write("EMBANKMENTTYPE 2\n")
-        hy8_file.write(f"NUMBEROFBARRELS {self.number_of_barrels}\n")
-        hy8_file.write(
-            f"INVERTDATA {self.inlet_invert_station} {self.inlet_invert_elevation} "
-            f"{self.outlet_invert_station} {self.outlet_invert_elevation}\n"
-        )
 
-        hy8_file.write(f'STARTCULVNOTES "{self.notes}"\nENDCULVNOTES\n')
         self.roadway_station = 0.0
-        hy8_file.write(f"ROADCULVSTATION {self.roadway_station}\n")
         self.barrel_spacing = 1.5 * self.span
-        hy8_file.write(f"BARRELSPACING {self.barrel_spacing}\n")
 
-        hy8_file.write(f'ENDCULVERT "{self.name}"\n')
-
-        return result, messages
+        return (
+            f'STARTCULVERT    "{self.name}"\n'
+            f"CULVERTSHAPE    {culvert_shape}\n"
+            f"CULVERTMATERIAL {culvert_material}\n"
+            f"INLETTYPE {self.inlet_type}\n"
+            f"INLETEDGETYPE {self.inlet_edge_type}\n"
+            f"INLETEDGETYPE71 {self.inlet_edge_type71}\n"
+            f"IMPINLETEDGETYPE {self.imp_inlet_edge_type}\n"
+            f"BARRELDATA  {self.span} {self.rise} {n_top} {n_bot}\n"
+            # Site Data
+            "EMBANKMENTTYPE 2\n"
+            f"NUMBEROFBARRELS {self.number_of_barrels}\n"
+            f"INVERTDATA {self.inlet_invert_station} {self.inlet_invert_elevation} "
+            f"{self.outlet_invert_station} {self.outlet_invert_elevation}\n"
+            f'STARTCULVNOTES "{self.notes}"\nENDCULVNOTES\n'
+            f"ROADCULVSTATION {self.roadway_station}\n"
+            f"BARRELSPACING {self.barrel_spacing}\n"
+            f'ENDCULVERT "{self.name}"\n'
+        )
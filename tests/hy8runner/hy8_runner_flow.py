@@ -2,34 +2,75 @@
 
 from __future__ import annotations
 
+import math
+from enum import IntEnum
+from itertools import pairwise
+
 __copyright__ = "(C) Copyright Aquaveo 2024"
 __license__ = "All rights reserved"
 # This is not a FHWA product nor is it endorsed by FHWA.
 # FHWA will not be providing any technical supporting, funding or maintenance.
 
 
+class _Method(IntEnum):
+    """Integer ids for the flow method names, so the hot paths compare ids instead of strings."""
+
+    MIN_DESIGN_MAX = 0
+    MIN_MAX_INCREMENT = 1
+    USER_DEFINED = 2
+
+
+_METHOD_IDS: dict[str, _Method] = {
+    "min-design-max": _Method.MIN_DESIGN_MAX,
+    "min-max-increment": _Method.MIN_MAX_INCREMENT,
+    "user-defined": _Method.USER_DEFINED,
+}
+
+
 class Hy8RunnerFlow:
     """A class that will create an HY-8 file and run HY-8."""
 
     def __init__(self) -> None:
         """Initializes the HY-8 Runner class."""
-        self.method: str = "min-design-max"  # 'min-design-max', 'user-defined', or 'min-max-increment'
+        self._method: str = "min-design-max"
+        self._method_id: _Method | None = _Method.MIN_DESIGN_MAX
         self.flow_min: float = 0.0
         self.flow_design: float = 0.0
         self.flow_max: float = 0.0
         self.flow_increment: float = 0.0
         self.flow_list: list[float] = []
 
+    @property
+    def method(self) -> str:
+        """The flow method: 'min-design-max', 'user-defined', or 'min-max-increment'."""
+        return self._method
+
+    @method.setter
+    def method(self, method: str) -> None:
+        self._method = method
+        self._method_id = _METHOD_IDS.get(method)  # None for unsupported names; reported by validation
+
+    @property
+    def is_min_design_max(self) -> bool:
+        """True when the flows are defined by minimum, design, and maximum values."""
+        return self._method_id is _Method.MIN_DESIGN_MAX
+
     def compute_list(self) -> None:
         """Compute the list of flows."""
-        if self.method == "min-design-max":
+        method_id = self._method_id
+        if method_id is _Method.MIN_DESIGN_MAX:
             self.flow_list = [self.flow_min, self.flow_design, self.flow_max]
-        elif self.method == "min-max-increment":
-            self.flow_list = []
-            flow = self.flow_min
-            while flow <= self.flow_max:
-                self.flow_list.append(flow)
-                flow += self.flow_increment
+        elif method_id is _Method.MIN_MAX_INCREMENT:
+            # Compute each flow from its index rather than accumulating the increment, so rounding error
+            # does not build up along the list. The small tolerance keeps a maximum that the increment lands on,
+            # and the clamp stops that last flow from rounding to just above the user's maximum.
+            if self.flow_increment <= 0.0 or self.flow_max < self.flow_min:
+                self.flow_list = []
+                return
+            count = math.floor((self.flow_max - self.flow_min) / self.flow_increment + 1e-9) + 1
+            flow_list = [self.flow_min + index * self.flow_increment for index in range(count)]
+            flow_list[-1] = min(flow_list[-1], self.flow_max)
+            self.flow_list = flow_list
 
     def validate_crossings_data(self, crossing_str: str) -> tuple[bool, str]:
         """Validate the data.
@@ -38,41 +79,39 @@ class Hy8RunnerFlow:
             bool: True if the data is valid.
             string: The error message if the data is not valid.
         """
-        messages = ""
+        parts: list[str] = []
         result = True
 
-        if self.method == "min-design-max":
+        method_id = self._method_id
+        if method_id is _Method.MIN_DESIGN_MAX:
             if self.flow_min >= self.flow_design:
-                messages += f"{crossing_str}Minimum flow must be less than or equal to design flow.\n"
+                parts.append(f"{crossing_str}Minimum flow must be less than or equal to design flow.\n")
                 result = False
             if self.flow_design >= self.flow_max:
-                messages += f"{crossing_str}Design flow must be less than or equal to maximum flow.\n"
+                parts.append(f"{crossing_str}Design flow must be less than or equal to maximum flow.\n")
                 result = False
             if self.flow_min < 0.0:
-                messages += f"{crossing_str}Minimum flow must be zero or greater.\n"
+                parts.append(f"{crossing_str}Minimum flow must be zero or greater.\n")
                 result = False
-        elif self.method == "min-max-increment":
+        elif method_id is _Method.MIN_MAX_INCREMENT:
             if self.flow_min >= self.flow_max:
-                messages += f"{crossing_str}Minimum flow must be less than maximum flow.\n"
+                parts.append(f"{crossing_str}Minimum flow must be less than maximum flow.\n")
                 result = False
             if self.flow_min < 0.0:
-                messages += f"{crossing_str}Minimum flow must be zero or greater.\n"
+                parts.append(f"{crossing_str}Minimum flow must be zero or greater.\n")
                 result = False
             if self.flow_increment <= 0.0:
-                messages += f"{crossing_str}Flow increment must be greater than zero.\n"
+                parts.append(f"{crossing_str}Flow increment must be greater than zero.\n")
                 result = False
-        elif self.method == "user-defined":
+        elif method_id is _Method.USER_DEFINED:
             if len(self.flow_list) < 2:
-                messages += f"{crossing_str}User-defined flow list must have at least two values.\n"
+                parts.append(f"{crossing_str}User-defined flow list must have at least two values.\n")
+                result = False
+            elif any(previous >= current for previous, current in pairwise(self.flow_list)):
+                parts.append(f"{crossing_str}Flow list values must increase in value.\n")
                 result = False
-            elif len(self.flow_list) >= 2:
-                for i in range(len(self.flow_list) - 1):
-                    if self.flow_list[i] >= self.flow_list[i + 1]:
-                        messages += f"{crossing_str}Flow list values must increase in value.\n"
-                        result = False
-                        break
         else:
-            messages += f"{crossing_str}Flow method must be min-design-max, user-defined, or min-max-increment.\n"
+            parts.append(f"{crossing_str}Flow method must be min-design-max, user-defined, or min-max-increment.\n")
             result = False
 
-        return result, messages
+        return result, "".join(parts)
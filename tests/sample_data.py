@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+from collections.abc import Callable
+from pathlib import Path
 
 from run_hy8 import (
     CulvertBarrel,
@@ -53,13 +57,38 @@ CONFIG_MAPPING: dict[str, object] = {
     ],
 }
 
+EXAMPLE_FILE: Path = Path(__file__).resolve().parent / "example_crossings.hy8"
+
 CONFIG_JSON: str = json.dumps(CONFIG_MAPPING, indent=2)
+CONFIG_JSON_BYTES: bytes = CONFIG_JSON.encode("utf-8")
+
+
+def _fresh_copies(builder: Callable[[], Hy8Project]) -> Callable[[], Hy8Project]:
+    """Build the project once per session and hand every caller its own deep copy.
+
+    Hy8FileWriter.write updates flow values in place, so a shared instance is not safe to return.
+    """
+    cached: Callable[[], Hy8Project] = functools.cache(builder)
+
+    @functools.wraps(builder)
+    def build() -> Hy8Project:
+        return copy.deepcopy(cached())
+
+    return build
 
 
+@_fresh_copies
 def build_sample_project() -> Hy8Project:
     """Construct a Hy8Project that mirrors the fixture configuration."""
 
     project = Hy8Project(title="Sample Project", designer="Hydraulics Team")
+    project.crossings.append(_build_sample_crossing())
+    return project
+
+
+def _build_sample_crossing() -> CulvertCrossing:
+    """Construct the single crossing described by the fixture configuration."""
+
     crossing = CulvertCrossing(name="Sample Crossing")
     crossing.flow = FlowDefinition(
         method=FlowMethod.MIN_DESIGN_MAX,
@@ -86,15 +115,14 @@ def build_sample_project() -> Hy8Project:
             outlet_invert_elevation=98.0,
         )
     )
-    project.crossings.append(crossing)
-    return project
+    return crossing
 
 
+@_fresh_copies
 def build_two_crossing_project() -> Hy8Project:
     project = Hy8Project(title="Two Crossings", designer="Hydraulics Team")
 
-    first = build_sample_project().crossings[0]
-    project.crossings.append(first)
+    project.crossings.append(_build_sample_crossing())
 
     second = CulvertCrossing(name="Second Crossing")
     second.flow.method = FlowMethod.USER_DEFINED
@@ -133,6 +161,7 @@ def build_two_crossing_project() -> Hy8Project:
     return project
 
 
+@_fresh_copies
 def build_user_defined_project() -> Hy8Project:
     project = Hy8Project(title="User Defined Flow", designer="Hydraulics Team")
     crossing = CulvertCrossing(name="User Crossing")
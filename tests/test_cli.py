@@ -8,12 +8,8 @@ from run_hy8 import Hy8Project
 from run_hy8 import cli
 from run_hy8.config import load_project_from_json
 
-from .sample_data import CONFIG_JSON
 
-
-def test_validate_only_mode(tmp_path: Path) -> None:
-    config_path: Path = tmp_path / "project.json"
-    config_path.write_text(CONFIG_JSON, encoding="utf-8")
+def test_validate_only_mode(tmp_path: Path, config_path: Path) -> None:
     output_path: Path = tmp_path / "result.hy8"
 
     exit_code: int = cli.main(
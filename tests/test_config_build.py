@@ -15,10 +15,7 @@ from run_hy8.writer import Hy8FileWriter
 from .sample_data import CONFIG_JSON
 
 
-def test_build_from_json_config(tmp_path: Path) -> None:
-    config_path: Path = tmp_path / "project.json"
-    config_path.write_text(data=CONFIG_JSON, encoding="utf-8")
-
+def test_build_from_json_config(tmp_path: Path, config_path: Path) -> None:
     project: Hy8Project = load_project_from_json(path=config_path)
     hy8_path: Path = Hy8FileWriter(project=project).write(output_path=tmp_path / "sample.hy8")
     contents: str = hy8_path.read_text(encoding="utf-8")
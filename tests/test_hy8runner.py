@@ -0,0 +1,185 @@
+"""Behavioural checks for the vendored legacy Hy8Runner used as the parity oracle."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from .hy8runner.hy8_runner import Hy8Runner
+from .hy8runner.hy8_runner_flow import Hy8RunnerFlow
+
+
+def _valid_runner(tmp_path: Path) -> Hy8Runner:
+    """Build a runner with one valid crossing, a stub executable, and an output file in a subdirectory."""
+    exe_dir: Path = tmp_path / "hy8"
+    exe_dir.mkdir()
+    (exe_dir / "HY864.exe").write_bytes(b"")
+
+    runner = Hy8Runner(hy8_exe_path=str(exe_dir), hy8_file=str(tmp_path / "out" / "project.hy8"))
+    runner.set_discharge_min_design_max_flow(flow_min=1.0, flow_design=2.0, flow_max=3.0)
+    runner.set_tw_constant(tw_invert_elevation=100.0, tw_constant_elevation=101.0)
+    runner.set_roadway_width(roadway_width=10.0)
+    runner.set_roadway_stations_and_elevations(stations=[0.0, 10.0], elevations=[105.0, 105.0])
+    runner.set_culvert_barrel_span_and_rise(span=1.0, rise=1.0)
+    runner.set_culvert_barrel_site_data(
+        inlet_invert_station=0.0,
+        inlet_invert_elevation=100.0,
+        outlet_invert_station=10.0,
+        outlet_invert_elevation=99.0,
+    )
+    return runner
+
+
+class _FakeProcess:
+    """Stand-in for a subprocess.Popen object that has already exited with a preset return code."""
+
+    def __init__(self, args: list[str], returncode: int) -> None:
+        self.args: list[str] = args
+        self.returncode: int = returncode
+
+    def wait(self) -> int:
+        return self.returncode
+
+
+class _FakeSubprocess:
+    """Records the commands passed to subprocess.run and subprocess.Popen instead of launching HY-8."""
+
+    def __init__(self) -> None:
+        self.run_commands: list[list[str]] = []
+        self.popen_commands: list[list[str]] = []
+        self.return_codes: list[int] = []
+
+    def run(self, args: Sequence[str], *_: Any, **__: Any) -> subprocess.CompletedProcess[bytes]:
+        self.run_commands.append(list(args))
+        return subprocess.CompletedProcess(args, 0)
+
+    def popen(self, args: Sequence[str], *_: Any, **__: Any) -> _FakeProcess:
+        self.popen_commands.append(list(args))
+        return _FakeProcess(list(args), self.return_codes.pop(0) if self.return_codes else 0)
+
+
+@pytest.fixture
+def fake_subprocess(monkeypatch: pytest.MonkeyPatch) -> _FakeSubprocess:
+    fake = _FakeSubprocess()
+    monkeypatch.setattr(subprocess, "run", fake.run)
+    monkeypatch.setattr(subprocess, "Popen", fake.popen)
+    return fake
+
+
+def test_missing_executable_is_reported_after_a_successful_create(tmp_path: Path) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+    success, messages = runner.create_hy8_file()
+    assert success, messages
+
+    (tmp_path / "hy8" / "HY864.exe").unlink()
+    success, messages = runner.validate_crossings_data()
+    assert not success
+    assert "HY-8 executable does not exist" in messages
+
+
+def test_deleted_file_is_recreated_without_overwrite(tmp_path: Path) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+    success, messages = runner.create_hy8_file()
+    assert success, messages
+
+    hy8_file = Path(runner.hy8_file)
+    hy8_file.unlink()
+    success, messages = runner.create_hy8_file(overwrite=False)
+    assert success, messages
+    assert hy8_file.is_file()
+
+
+def test_removed_output_directory_is_recreated(tmp_path: Path) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+    success, messages = runner.create_hy8_file()
+    assert success, messages
+
+    hy8_file = Path(runner.hy8_file)
+    hy8_file.unlink()
+    hy8_file.parent.rmdir()
+    success, messages = runner.create_hy8_file()
+    assert success, messages
+    assert hy8_file.is_file()
+
+
+def test_directory_at_hy8_path_is_reported_not_raised(tmp_path: Path) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+    Path(runner.hy8_file).mkdir(parents=True)
+
+    success, messages = runner.create_hy8_file()
+    assert not success
+    assert "is locked" in messages
+
+
+def test_repeated_roadway_stations_are_accepted_like_run_hy8(tmp_path: Path) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+    runner.set_roadway_stations_and_elevations(stations=[0.0, 0.0, 10.0], elevations=[105.0, 105.0, 105.0])
+
+    success, messages = runner.validate_crossings_data()
+    assert success, messages
+
+
+@pytest.mark.parametrize(
+    ("flow_min", "flow_max", "flow_increment"),
+    [(0.0, 0.7, 0.1), (0.0, 1.4, 0.2), (0.1, 0.7, 0.1), (1.0, 10.0, 3.0)],
+)
+def test_min_max_increment_flows_never_exceed_maximum(flow_min: float, flow_max: float, flow_increment: float) -> None:
+    flow = Hy8RunnerFlow()
+    flow.method = "min-max-increment"
+    flow.flow_min, flow.flow_max, flow.flow_increment = flow_min, flow_max, flow_increment
+    flow.compute_list()
+
+    assert flow.flow_list[0] == flow_min
+    assert max(flow.flow_list) <= flow_max
+    assert flow.flow_list[-1] > flow_max - flow_increment
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("run_build_full_report", {}),
+        ("run_open_save", {}),
+        ("run_open_save_plots", {}),
+        ("run_build_flow_tw_table", {}),
+        ("run_build_flow_tw_table", {"flow_coef": 1.5, "flow_const": 0.5, "units": "SI", "hw_inc": 0.1, "tw_inc": 0.2}),
+        ("run_build_hw_tw_table", {}),
+        ("run_build_hw_tw_table", {"units": "SI", "hw_inc": 0.1, "tw_inc": 0.2}),
+    ],
+)
+def test_async_methods_launch_the_same_command_as_their_sync_twin(
+    tmp_path: Path, fake_subprocess: _FakeSubprocess, method: str, kwargs: dict[str, Any]
+) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+
+    getattr(runner, method)(**kwargs)
+    getattr(runner, f"{method}_async")(**kwargs)
+
+    assert len(fake_subprocess.run_commands) == 1
+    assert fake_subprocess.popen_commands == fake_subprocess.run_commands
+    assert fake_subprocess.run_commands[0][0] == str(tmp_path / "hy8" / "HY864.exe")
+    assert fake_subprocess.run_commands[0][-1] == runner.hy8_file
+
+
+def test_wait_all_returns_codes_in_launch_order_and_clears_pending(
+    tmp_path: Path, fake_subprocess: _FakeSubprocess
+) -> None:
+    runner: Hy8Runner = _valid_runner(tmp_path)
+    fake_subprocess.return_codes = [0, 3, 1]
+
+    runner.run_open_save_async()
+    runner.run_build_full_report_async()
+    runner.run_open_save_plots_async()
+
+    assert [command[1] for command in fake_subprocess.popen_commands] == [
+        "-OpenRunSave",
+        "-BuildFullReport",
+        "-OpenRunSavePlots",
+    ]
+    assert runner.wait_all() == [0, 3, 1]
+    assert not runner._pending
+    assert runner.wait_all() == []
+    assert not fake_subprocess.run_commands
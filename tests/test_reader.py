@@ -2,75 +2,110 @@
 
 from __future__ import annotations
 
+import math
+import os
 import shutil
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from subprocess import CompletedProcess
+from typing import cast
 
 import pytest
 
 from run_hy8 import CulvertMaterial, UnitSystem
 from run_hy8.executor import Hy8Executable
-from run_hy8.models import CulvertBarrel, CulvertCrossing, Hy8Project
-from run_hy8.reader import load_project_from_hy8
+from run_hy8.models import CulvertCrossing, Hy8Project
 from run_hy8.results import FlowProfile, Hy8Series, parse_rsql, parse_rst
 from run_hy8.units import cfs_to_cms
 from run_hy8.writer import Hy8FileWriter
 
-EXAMPLE_FILE: Path = Path(__file__).resolve().parent / "example_crossings.hy8"
-
-
-def test_loads_example_crossings(tmp_path: Path) -> None:
-    project: Hy8Project = load_project_from_hy8(path=EXAMPLE_FILE)
-
-    assert project.units is UnitSystem.SI
+from .sample_data import EXAMPLE_FILE
+
+EXAMPLE_EXPECTATIONS: list[tuple[str, object]] = [
+    ("units", UnitSystem.SI),
+    ("crossings.0.name", "HDPE 900x11"),
+    ("crossings.0.flow.user_value_labels", ["q", "w", "e"]),
+    ("crossings.0.culverts.0.inlet_type", 1),
+    ("crossings.0.culverts.0.inlet_edge_type", 0),
+    ("crossings.0.culverts.0.inlet_edge_type71", 0),
+    ("crossings.0.culverts.0.improved_inlet_edge_type", 1),
+    ("crossings.-1.name", "Two culverts one crossing"),
+    ("crossings.-1.culverts.0.material", CulvertMaterial.HDPE),
+]
+
+# Resolved once at import; only the test that runs HY-8 is skipped, the parsing tests run everywhere.
+_HY8_EXE: Path = Hy8Executable.default_path()
+_skip_without_hy8: pytest.MarkDecorator = pytest.mark.skipif(
+    os.name != "nt" or not _HY8_EXE.is_file(),
+    reason=f"HY-8 executable not available at {_HY8_EXE}. Update HY8_PATH.txt or HY8_EXE.",
+)
+
+# Line prefix -> fragment the round-trip output must contain on at least one such line.
+ROUND_TRIP_LINES: dict[str, str] = {
+    "DISCHARGEXYUSER_NAME": '"q"',
+    "ENDCULVERT": '"Culvert 1"',
+    "ENDCROSSING": '"Two culverts one crossing"',
+}
+
+
+@pytest.mark.parametrize(("path", "expected"), EXAMPLE_EXPECTATIONS, ids=[path for path, _ in EXAMPLE_EXPECTATIONS])
+def test_example_crossings_fields(example_project: Hy8Project, path: str, expected: object) -> None:
+    assert _resolve(example_project, path) == expected
+
+
+def test_loads_example_crossings(example_project: Hy8Project) -> None:
+    project: Hy8Project = example_project
     assert len(project.crossings) == 7
     first: CulvertCrossing = project.crossings[0]
-    assert first.name == "HDPE 900x11"
-    assert first.flow.sequence() == pytest.approx(  # pyright: ignore[reportUnknownMemberType]
-        expected=[cfs_to_cms(282.517334), cfs_to_cms(317.832), cfs_to_cms(353.146667)]
+    assert _approx_equal(
+        first.flow.sequence(),
+        [cfs_to_cms(282.517334), cfs_to_cms(317.832), cfs_to_cms(353.146667)],
+        rel=1e-6,
     )
-    assert first.flow.user_value_labels == ["q", "w", "e"]
-    first_culvert: CulvertBarrel = first.culverts[0]
-    assert first_culvert.inlet_type == 1
-    assert first_culvert.inlet_edge_type == 0
-    assert first_culvert.inlet_edge_type71 == 0
-    assert first_culvert.improved_inlet_edge_type == 1
-    last: CulvertCrossing = project.crossings[-1]
-    assert last.name == "Two culverts one crossing"
-    assert len(last.culverts) == 2
-    assert last.culverts[0].material is CulvertMaterial.HDPE
-
-    generated: Path = Hy8FileWriter(project=project).write(output_path=tmp_path / "round_trip.hy8")
-    assert generated.exists()
-    lines = generated.read_text(encoding="utf-8").splitlines()
-    assert any(line.startswith("DISCHARGEXYUSER_NAME") and '"q"' in line for line in lines)
-    assert any(line.startswith("ENDCULVERT") and '"Culvert 1"' in line for line in lines)
-    assert any(line.startswith("ENDCROSSING") and '"Two culverts one crossing"' in line for line in lines)
+    assert len(project.crossings[-1].culverts) == 2
 
 
-@pytest.mark.requires_hy8
-def test_example_crossings_results_match(tmp_path: Path) -> None:
-    hy8_path: Path = Hy8Executable.default_path()
-    if not hy8_path.exists():
-        pytest.fail(f"HY-8 executable not found at {hy8_path}. Update HY8_PATH.txt or HY8_EXE.")
+@pytest.fixture(scope="session")
+def round_trip_file(example_project: Hy8Project, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the parsed example back out once per session."""
+    output_dir: Path = tmp_path_factory.mktemp("roundtrip", numbered=False)
+    return Hy8FileWriter(project=example_project).write(output_path=output_dir / "round_trip.hy8")
+
 
-    project: Hy8Project = load_project_from_hy8(EXAMPLE_FILE)
-    regenerated: Path = Hy8FileWriter(project=project).write(output_path=tmp_path / "regenerated.hy8")
+def test_round_trip_writes_file(round_trip_file: Path) -> None:
+    assert round_trip_file.exists()
+    pending: dict[str, str] = dict(ROUND_TRIP_LINES)
+    with round_trip_file.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            prefix: str = line.split(" ", 1)[0]
+            fragment: str | None = pending.get(prefix)
+            if fragment is not None and fragment in line:
+                del pending[prefix]
+                if not pending:
+                    break
+    assert not pending, f"round-trip output is missing lines for {sorted(pending)}"
+
+
+@pytest.mark.requires_hy8
+@_skip_without_hy8
+def test_example_crossings_results_match(tmp_path: Path, example_project: Hy8Project) -> None:
+    regenerated: Path = Hy8FileWriter(project=example_project).write(output_path=tmp_path / "regenerated.hy8")
     original_copy: Path = tmp_path / "original.hy8"
     shutil.copy(src=EXAMPLE_FILE, dst=original_copy)
 
-    executable = Hy8Executable(exe_path=hy8_path)
+    executable = Hy8Executable(exe_path=_HY8_EXE)
 
     _run_hy8_and_wait(executable=executable, hy8_file=original_copy)
     _run_hy8_and_wait(executable=executable, hy8_file=regenerated)
 
     original_rst: dict[str, Hy8Series] = parse_rst(path=original_copy.with_suffix(suffix=".rst"))
     regenerated_rst: dict[str, Hy8Series] = parse_rst(path=regenerated.with_suffix(suffix=".rst"))
-    assert original_rst == regenerated_rst
+    assert _structurally_close(original_rst, regenerated_rst)
 
     original_rsql: dict[str, list[FlowProfile]] = parse_rsql(path=original_copy.with_suffix(suffix=".rsql"))
     regenerated_rsql: dict[str, list[FlowProfile]] = parse_rsql(path=regenerated.with_suffix(suffix=".rsql"))
-    assert original_rsql == regenerated_rsql
+    assert _structurally_close(original_rsql, regenerated_rsql)
 
 
 def _run_hy8_and_wait(executable: Hy8Executable, hy8_file: Path) -> None:
@@ -78,3 +113,38 @@ def _run_hy8_and_wait(executable: Hy8Executable, hy8_file: Path) -> None:
     completed: CompletedProcess[str] = executable.open_run_save(hy8_file=hy8_file)
     if completed.returncode != 0:  # pragma: no cover - defensive guard
         raise RuntimeError(f"HY-8 execution failed: {completed.stderr.strip()}")
+
+
+def _approx_equal(a: Sequence[float], b: Sequence[float], rel: float = 1e-9, abs_: float = 1e-9) -> bool:
+    """Element-wise math.isclose over two float sequences of equal length."""
+    return len(a) == len(b) and all(math.isclose(x, y, rel_tol=rel, abs_tol=abs_) for x, y in zip(a, b))
+
+
+def _structurally_close(a: object, b: object, rel: float = 1e-9, abs_: float = 1e-9) -> bool:
+    """Compare parsed HY-8 results, using math.isclose on float leaves and treating NaN as equal to NaN."""
+    if isinstance(a, float) and isinstance(b, float):
+        if math.isnan(a) or math.isnan(b):
+            return math.isnan(a) and math.isnan(b)
+        return math.isclose(a, b, rel_tol=rel, abs_tol=abs_)
+    if isinstance(a, dict) and isinstance(b, dict):
+        left, right = cast(dict[object, object], a), cast(dict[object, object], b)
+        return left.keys() == right.keys() and all(_structurally_close(left[k], right[k], rel, abs_) for k in left)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        left_items, right_items = cast(Sequence[object], a), cast(Sequence[object], b)
+        return len(left_items) == len(right_items) and all(
+            _structurally_close(x, y, rel, abs_) for x, y in zip(left_items, right_items)
+        )
+    if is_dataclass(a) and not isinstance(a, type) and type(a) is type(b):
+        return all(_structurally_close(getattr(a, f.name), getattr(b, f.name), rel, abs_) for f in fields(a))
+    return a == b
+
+
+def _resolve(root: object, path: str) -> object:
+    """Follow a dotted path of attribute names and integer list indices from root."""
+    value: object = root
+    for part in path.split("."):
+        if part.lstrip("-").isdigit():
+            value = cast(Sequence[object], value)[int(part)]
+        else:
+            value = getattr(value, part)
+    return value
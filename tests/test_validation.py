@@ -1,6 +1,7 @@
 """Targeted validation coverage for the run_hy8 domain model."""
 
 from __future__ import annotations
+
 from pathlib import Path
 
 import pytest
@@ -13,8 +14,14 @@ from run_hy8.writer import Hy8FileWriter
 from .sample_data import build_sample_project
 
 
-def test_tailwater_must_be_constant(tmp_path: Path) -> None:
-    project: Hy8Project = build_sample_project()
+@pytest.fixture
+def sample_project() -> Hy8Project:
+    """A fresh sample project that each test may mutate."""
+    return build_sample_project()
+
+
+def test_tailwater_must_be_constant(tmp_path: Path, sample_project: Hy8Project) -> None:
+    project: Hy8Project = sample_project
     project.crossings[0].tailwater.tw_type = TailwaterType.RECTANGULAR
 
     errors: list[str] = project.crossings[0].validate("Sample Crossing: ")
@@ -24,15 +31,15 @@ def test_tailwater_must_be_constant(tmp_path: Path) -> None:
         Hy8FileWriter(project=project).write(tmp_path / "invalid.hy8")
 
 
-def test_tailwater_cannot_reach_roadway() -> None:
-    project: Hy8Project = build_sample_project()
+def test_tailwater_cannot_reach_roadway(sample_project: Hy8Project) -> None:
+    project: Hy8Project = sample_project
     project.crossings[0].tailwater.constant_elevation = 102.5  # higher than crest (101.5)
     errors: list[str] = project.crossings[0].validate("Sample Crossing: ")
     assert any("roadway crest" in message for message in errors)
 
 
-def test_assert_valid_only_raises_for_invalid_models() -> None:
-    project: Hy8Project = build_sample_project()
+def test_assert_valid_only_raises_for_invalid_models(sample_project: Hy8Project) -> None:
+    project: Hy8Project = sample_project
     project.assert_valid()
 
     project.crossings.clear()